@@ -25,15 +25,17 @@ Functions:
 """
 
 
-import argparse as ap
+import csv
 import datetime as dt
 import enum
 import pathlib as pl
-import string as st
+import sys
 import time
+import types
 import typing as ty
 
-import pandas as pd
+# Returns the number of seconds since 1970-01-01 00:00:00 UTC as a float.
+_now = time.time
 
 
 class State(enum.Enum):
@@ -58,8 +60,11 @@ class PunchClock:
         reset
     """
 
+    # pylint: disable=too-many-instance-attributes
+
     _COLUMN_NAMES = (State.IN.value, State.OUT.value)
-    _NO_DECIMAL_POINT = "%.0f"
+    _LINE_TERMINATOR = "\n"
+    _HEADER = ",".join(_COLUMN_NAMES).encode()
 
     def __init__(self, log_path: pl.Path) -> None:
         """Initializes an instance of this class.
@@ -69,83 +74,196 @@ class PunchClock:
         Args:
             log_path: The path to the file in which punches are logged.
         """
+        self._frozen_time: int | None = None
         try:
-            self._frame = pd.read_csv(log_path)
-        except (FileNotFoundError, pd.errors.EmptyDataError):
-            self.reset()
-        if not self._frame[State.OUT.value].empty and pd.isnull(
-            self._frame[State.OUT.value].iloc[-1]
-        ):
-            self._state = State.IN
-        else:
-            self._state = State.OUT
+            with open(log_path, "rb") as log_file:
+                data = log_file.read()
+        except FileNotFoundError:
+            data = b""
         self._log_path = log_path
+        self._punches, self._closed_seconds = self._parse_rows(data)
+        self._clocked_in = bool(self._punches) and self._punches[-1][1] is None
+        # Only the last row of the log is ever modified, so the log can
+        # be updated in place as long as it has a header and its rows end
+        # with bare newlines.
+        self._saved_count = len(self._punches)
+        self._end_offset = len(data)
+        self._last_row_offset = data.rfind(b"\n", 0, -1) + 1
+        has_header = self._has_header(data)
+        self._unchanged: int | None
+        if has_header and self._is_appendable(data):
+            self._unchanged = self._saved_count
+        else:
+            self._unchanged = None
+        # A log without a header is written out regardless.
+        self._dirty = not has_header
 
     def __enter__(self) -> "PunchClock":
+        """Freezes the current time until the end of the `with` block."""
+        self._frozen_time = int(_now())
         return self
 
     def __exit__(self, *_: ty.Any) -> None:
-        """Writes the log of clock punches to disk."""
-        # Pandas cannot represent missing values in integer series
-        # <http://pandas.pydata.org/pandas-docs/stable/gotchas.html#support-for-integer-na>,
-        # so the timestamps are stored as floating-point numbers.
-        self._frame.to_csv(
-            self._log_path, index=False, float_format=self._NO_DECIMAL_POINT
-        )
+        """Writes the log of clock punches to disk.
+
+        Nothing is written unless the log has changed, and rows which
+        are unchanged on disk are not rewritten.
+        """
+        self._frozen_time = None
+        if not self._dirty:
+            return
+        if self._unchanged is None:
+            with open(
+                self._log_path, "w", newline="", encoding="utf-8"
+            ) as log_file:
+                writer = self._make_writer(log_file)
+                writer.writerow(self._COLUMN_NAMES)
+                writer.writerows(self._format_punches(self._punches))
+        else:
+            if self._unchanged < self._saved_count:
+                offset = self._last_row_offset
+            else:
+                offset = self._end_offset
+            with open(
+                self._log_path, "a", newline="", encoding="utf-8"
+            ) as log_file:
+                log_file.truncate(offset)
+                writer = self._make_writer(log_file)
+                writer.writerows(
+                    self._format_punches(self._punches[self._unchanged :])
+                )
 
     @property
     def state(self) -> State:
         """Returns the state of the punch clock."""
-        return self._state
+        return State.IN if self._clocked_in else State.OUT
+
+    @property
+    def _current_time(self) -> int:
+        """Returns the frozen time inside a `with` block, else the time."""
+        if self._frozen_time is None:
+            return int(_now())
+        return self._frozen_time
 
     def punch_in(self) -> None:
         """Punches in."""
-        if self.state == State.OUT:
-            now = self._get_current_time()
-            self._frame.loc[-1] = [now, None]
-            self._state = State.IN
+        if not self._clocked_in:
+            self._punches.append((self._current_time, None))
+            self._clocked_in = True
+            self._dirty = True
 
     def punch_out(self) -> None:
         """Punches out."""
-        if self.state == State.IN:
-            now = self._get_current_time()
-            last_idx = self._frame.shape[0] - 1
-            self._frame.loc[last_idx, State.OUT.value] = now
-            self._state = State.OUT
+        if self._clocked_in:
+            now = self._current_time
+            last_idx = len(self._punches) - 1
+            clocked_in, _ = self._punches[last_idx]
+            self._punches[last_idx] = (clocked_in, now)
+            self._closed_seconds += now - clocked_in
+            if self._unchanged is not None:
+                self._unchanged = min(self._unchanged, last_idx)
+            self._clocked_in = False
+            self._dirty = True
 
     def sum(self) -> dt.timedelta:
         """Returns the time worked."""
-        elapsed_seconds_series = (
-            self._frame[State.OUT.value] - self._frame[State.IN.value]
-        )
-        elapsed_seconds = elapsed_seconds_series.sum()
-        if self.state == State.IN:
-            clocked_in = self._frame[State.IN.value].iloc[-1]
-            now = self._get_current_time()
-            elapsed_seconds += now - clocked_in
-        elapsed_seconds_int = int(elapsed_seconds)
-        return dt.timedelta(seconds=elapsed_seconds_int)
+        elapsed_seconds = self._closed_seconds
+        if self._clocked_in:
+            clocked_in, _ = self._punches[-1]
+            elapsed_seconds += self._current_time - clocked_in
+        return dt.timedelta(seconds=elapsed_seconds)
 
     def reset(self) -> None:
         """Resets the log of clock punches."""
-        self._frame = pd.DataFrame(columns=self._COLUMN_NAMES)
-        self._state = State.OUT
+        self._punches = []
+        self._clocked_in = False
+        self._closed_seconds = 0
+        self._unchanged = None
+        self._dirty = True
+
+    @classmethod
+    def _has_header(cls, data: bytes) -> bool:
+        """Returns whether some data starts with the log's header.
+
+        Args:
+            data: The start of the log of clock punches.
+        """
+        return data.startswith((cls._HEADER + b"\n", cls._HEADER + b"\r\n"))
+
+    @staticmethod
+    def _is_appendable(data: bytes) -> bool:
+        """Returns whether rows can be appended to the end of some data.
+
+        Args:
+            data: The end of the log of clock punches.
+        """
+        return data.endswith(b"\n") and not data.endswith((b"\r\n", b"\n\n"))
 
     @staticmethod
-    def _get_current_time() -> int:
-        """Returns the number of seconds since 1970-01-01 00:00:00 UTC."""
-        current_time = time.time()
-        return int(current_time)
+    def _parse_rows(
+        data: bytes,
+    ) -> tuple[list[tuple[int, int | None]], int]:
+        """Parses the rows of the log of clock punches.
+
+        Args:
+            data: The log, starting with its header.
+
+        Returns:
+            A tuple. The first element is the clock punches, and the
+            second element is the number of seconds in closed intervals.
+        """
+        punches: list[tuple[int, int | None]] = []
+        closed_seconds = 0
+        reader = csv.reader(data.decode("utf-8").splitlines())
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            clocked_in = int(row[0])
+            if row[1]:
+                clocked_out = int(row[1])
+                closed_seconds += clocked_out - clocked_in
+                punches.append((clocked_in, clocked_out))
+            else:
+                punches.append((clocked_in, None))
+        return punches, closed_seconds
+
+    def _make_writer(self, log_file: ty.TextIO) -> ty.Any:
+        """Returns a CSV writer for the log of clock punches.
+
+        Args:
+            log_file: The log file, opened for writing.
+        """
+        return csv.writer(log_file, lineterminator=self._LINE_TERMINATOR)
+
+    @staticmethod
+    def _format_punches(
+        punches: ty.Iterable[tuple[int, int | None]]
+    ) -> ty.Iterator[tuple[int, int | str]]:
+        """Returns clock punches formatted as rows of the log.
+
+        Args:
+            punches: Pairs of timestamps, the second of which is `None`
+                while clocked in.
+        """
+        return (
+            (clocked_in, "" if clocked_out is None else clocked_out)
+            for clocked_in, clocked_out in punches
+        )
 
 
 _LOG_PATH = pl.Path.home() / ".punch_clock"
-_MESSAGE_TEMPLATE = st.Template(
-    "You have worked ${time}; you are clocked ${state}."
-)
 
 
-def main():
-    """Executes this script's main functionality."""
+def _parse_args() -> ty.Any:
+    """Returns the parsed command-line arguments."""
+    if len(sys.argv) == 1:
+        # Without arguments, every flag is unset, so the parser need not
+        # be built.
+        return types.SimpleNamespace(in_=False, out=False, reset=False)
+    # Imported here so that merely importing this module stays cheap.
+    import argparse as ap  # pylint: disable=import-outside-toplevel
+
     parser = ap.ArgumentParser(description="personal punch clock")
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
@@ -158,7 +276,12 @@ def main():
         action="store_true",
         help="delete the stored clock punches",
     )
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def main():
+    """Executes this script's main functionality."""
+    args = _parse_args()
     with PunchClock(_LOG_PATH) as clock:
         if args.in_:
             clock.punch_in()
@@ -168,11 +291,7 @@ def main():
             clock.reset()
         work_time = clock.sum()
         clocked_state = clock.state.value.lower()
-    work_time_str = str(work_time)
-    message = _MESSAGE_TEMPLATE.substitute(
-        time=work_time_str, state=clocked_state
-    )
-    print(message)
+    print(f"You have worked {work_time}; you are clocked {clocked_state}.")
 
 
 if __name__ == "__main__":
@@ -16,8 +16,8 @@
 """This module contains its namesake class."""
 
 
-import argparse as ap
 import datetime as dt
+import itertools as it
 import pathlib as pl
 import shutil
 import time
@@ -53,6 +53,7 @@ class TestPunchClock:
     _PART_MANY_IN = dt.timedelta(seconds=20478)
     _TOTAL_MANY_OUT = _PART_MANY_IN + dt.timedelta(seconds=12034)
     _LAST_IDX = 2
+    _FROZEN_TIME = 1513600731
 
     def test_init_blank(self, tmp_log: pl.Path) -> None:
         """Tests the method `__init__` with a blank log."""
@@ -70,8 +71,13 @@ class TestPunchClock:
         """Tests the method `__init__` with the user clocked in."""
         self._assert_nothing_changes(self._IN, pc.State.IN)
 
-    def test_punch_in_first(self, tmp_log: pl.Path) -> None:
+    @pytest.mark.parametrize("content", [None, b"", b"\n"])
+    def test_punch_in_first(
+        self, tmp_log: pl.Path, content: bytes | None
+    ) -> None:
         """Tests the method `punch_in` with no clock punches."""
+        if content is not None:
+            tmp_log.write_bytes(content)
         with pc.PunchClock(tmp_log) as clock:
             clock.punch_in()
             assert clock.state == pc.State.IN
@@ -83,6 +89,21 @@ class TestPunchClock:
             self._IN, pc.State.IN, pc.PunchClock.punch_in.__name__
         )
 
+    def test_punch_in_many_out(self, tmp_log: pl.Path) -> None:
+        """Tests the method `punch_in` with many punches when clocked out."""
+        shutil.copy(self._MANY_OUT, tmp_log)
+        original = pd.read_csv(tmp_log)
+        with pc.PunchClock(tmp_log) as clock:
+            clock.punch_in()
+            assert clock.state == pc.State.IN
+            clock.punch_out()
+            assert clock.state == pc.State.OUT
+        reopened = pd.read_csv(tmp_log)
+        pd.testing.assert_frame_equal(original, reopened.iloc[:-1])
+        last = reopened.iloc[-1]
+        self._assert_small(time.time() - last[pc.State.IN.value])
+        self._assert_small(time.time() - last[pc.State.OUT.value])
+
     def test_punch_out_in(self, tmp_log: pl.Path) -> None:
         """Tests the method `punch_out` when clocked in."""
         shutil.copy(self._IN, tmp_log)
@@ -117,12 +138,41 @@ class TestPunchClock:
             check_exact=False,
         )
 
+    def test_punch_out_crlf(self, tmp_log: pl.Path) -> None:
+        """Tests the method `punch_out` with a log ending in CRLF."""
+        tmp_log.write_bytes(self._IN.read_bytes().replace(b"\n", b"\r\n"))
+        with pc.PunchClock(tmp_log) as clock:
+            clock.punch_out()
+        reopened = self._assert_recent_integral(tmp_log, pc.State.OUT)
+        assert reopened.shape == (1, 2)
+
     def test_sum_blank(self, tmp_log: pl.Path) -> None:
         """Tests the method `sum` with a blank log."""
         tmp_log.touch()
         with pc.PunchClock(tmp_log) as clock:
             assert clock.sum() == dt.timedelta(0)
 
+    def test_sum_punch_in(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_log: pl.Path
+    ) -> None:
+        """Tests the method `sum` right after the method `punch_in`."""
+        monkeypatch.setattr(pc, "_now", it.count(self._FROZEN_TIME).__next__)
+        with pc.PunchClock(tmp_log) as clock:
+            clock.punch_in()
+            assert clock.sum() == dt.timedelta(0)
+        modified = pd.read_csv(tmp_log)
+        assert modified[pc.State.IN.value][0] == self._FROZEN_TIME
+
+    def test_sum_unfrozen(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_log: pl.Path
+    ) -> None:
+        """Tests the method `sum` outside a `with` block."""
+        monkeypatch.setattr(pc, "_now", it.count(self._FROZEN_TIME).__next__)
+        clock = pc.PunchClock(tmp_log)
+        clock.punch_in()
+        assert clock.sum() == dt.timedelta(seconds=1)
+        assert clock.sum() == dt.timedelta(seconds=2)
+
     def test_sum_in(self) -> None:
         """Tests the method `sum` when clocked in."""
         total, original = self._assert_nothing_changes(
@@ -159,10 +209,13 @@ class TestPunchClock:
         diff_seconds = diff_time_delta.total_seconds()
         self._assert_small(diff_seconds)
 
-    def test_sum_many_out(self) -> None:
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n"])
+    def test_sum_many_out(self, tmp_log: pl.Path, newline: bytes) -> None:
         """Tests the method `sum` with many punches when clocked out."""
+        data = self._MANY_OUT.read_bytes()
+        tmp_log.write_bytes(data.replace(b"\n", newline))
         self._assert_nothing_changes(
-            self._MANY_OUT,
+            tmp_log,
             pc.State.OUT,
             pc.PunchClock.sum.__name__,
             self._TOTAL_MANY_OUT,
@@ -232,6 +285,7 @@ class TestPunchClock:
             its original state.
         """
         original = pd.read_csv(log_path)
+        original_bytes = log_path.read_bytes()
         with pc.PunchClock(log_path) as clock:
             assert clock.state == state
             if method_name:
@@ -244,6 +298,7 @@ class TestPunchClock:
             assert clock.state == state
         reopened = pd.read_csv(log_path)
         pd.testing.assert_frame_equal(original, reopened)
+        assert log_path.read_bytes() == original_bytes
         return return_value, original
 
     def _test_reset(
@@ -269,18 +324,18 @@ class TestPunchClock:
 
 
 @pytest.mark.parametrize(
-    "name_space, state, work_time",
+    "args, state, work_time",
     [
-        (ap.Namespace(in_=False, out=False, reset=False), "out", "2:26:49"),
-        (ap.Namespace(in_=True, out=False, reset=False), "in", "2:26:49"),
-        (ap.Namespace(in_=False, out=True, reset=False), "out", "2:26:49"),
-        (ap.Namespace(in_=False, out=False, reset=True), "out", "0:00:00"),
+        ([], "out", "2:26:49"),
+        (["--in"], "in", "2:26:49"),
+        (["--out"], "out", "2:26:49"),
+        (["--reset"], "out", "0:00:00"),
     ],
 )
 def test_main(
     capsys: pytest.CaptureFixture,
     tmp_log: pl.Path,
-    name_space: ap.Namespace,
+    args: list[str],
     state: str,
     work_time: str,
 ) -> None:
@@ -289,8 +344,7 @@ def test_main(
     source = _TEST_DIR / "main.csv"
     shutil.copy(source, tmp_log)
     pc._LOG_PATH = tmp_log
-    with mock.patch("argparse.ArgumentParser.parse_args") as mock_parse_args:
-        mock_parse_args.return_value = name_space
+    with mock.patch("sys.argv", ["punch-clock", *args]):
         pc.main()
     captured = capsys.readouterr()
     assert (